@@ -142,6 +142,7 @@ def configure_logging(level: Optional[int] = None):
 
 from .geometry_generic import get_distance
 from .geometry_generic import rotate_point
+from .geometry_generic import rotate_points
 from .geometry_generic import clamp
 from .geometry_generic import get_angle_degrees
 from .geometry_generic import get_angle_radians
@@ -562,6 +563,7 @@ def configure_logging(level: Optional[int] = None):
     'read_tmx',
     'load_tilemap',
     'rotate_point',
+    'rotate_points',
     'run',
     'schedule',
     'screen_to_isometric_grid',
@@ -28,7 +28,7 @@
 from arcade.gl import Program
 from arcade.gl import Buffer
 
-from .geometry_generic import rotate_point
+from .geometry_generic import rotate_points
 
 
 class Shape:
@@ -341,13 +341,12 @@ def get_rectangle_points(center_x: float, center_y: float, width: float,
     x4 = width / 2 + center_x
     y4 = -height / 2 + center_y
 
+    points = [(x1, y1), (x2, y2), (x3, y3), (x4, y4)]
+
     if tilt_angle:
-        x1, y1 = rotate_point(x1, y1, center_x, center_y, tilt_angle)
-        x2, y2 = rotate_point(x2, y2, center_x, center_y, tilt_angle)
-        x3, y3 = rotate_point(x3, y3, center_x, center_y, tilt_angle)
-        x4, y4 = rotate_point(x4, y4, center_x, center_y, tilt_angle)
+        return rotate_points(points, center_x, center_y, tilt_angle)
 
-    return [(x1, y1), (x2, y2), (x3, y3), (x4, y4)]
+    return points
 
 
 def create_rectangle(center_x: float, center_y: float, width: float,
@@ -393,11 +392,7 @@ def create_rectangle(center_x: float, center_y: float, width: float,
         data = [o_lt, i_lt, o_rt, i_rt, o_rb, i_rb, o_lb, i_lb, o_lt, i_lt]
 
         if tilt_angle != 0:
-            point_list_2: List[Point] = []
-            for point in data:
-                new_point = rotate_point(point[0], point[1], center_x, center_y, tilt_angle)
-                point_list_2.append(new_point)
-            data = point_list_2
+            data = rotate_points(data, center_x, center_y, tilt_angle)
 
         border_width = 1
 
@@ -527,11 +522,11 @@ def create_ellipse(center_x: float, center_y: float,
         x = width / 2 * math.cos(theta) + center_x
         y = height / 2 * math.sin(theta) + center_y
 
-        if tilt_angle:
-            x, y = rotate_point(x, y, center_x, center_y, tilt_angle)
-
         point_list.append((x, y))
 
+    if tilt_angle:
+        point_list = rotate_points(point_list, center_x, center_y, tilt_angle)
+
     if filled:
         half = len(point_list) // 2
         interleaved = itertools.chain.from_iterable(
@@ -574,7 +569,7 @@ def create_ellipse_filled_with_colors(center_x: float, center_y: float,
     """
     # Create an array with the vertex data
     # Create an array with the vertex point_list
-    point_list = [(center_x, center_y)]
+    segment_points = []
 
     for segment in range(num_segments):
         theta = 2.0 * 3.1415926 * segment / num_segments
@@ -582,10 +577,12 @@ def create_ellipse_filled_with_colors(center_x: float, center_y: float,
         x = width * math.cos(theta) + center_x
         y = height * math.sin(theta) + center_y
 
-        if tilt_angle:
-            x, y = rotate_point(x, y, center_x, center_y, tilt_angle)
+        segment_points.append((x, y))
 
-        point_list.append((x, y))
+    if tilt_angle:
+        segment_points = rotate_points(segment_points, center_x, center_y, tilt_angle)
+
+    point_list = [(center_x, center_y)] + segment_points
     point_list.append(point_list[1])
 
     color_list = [inside_color] + [outside_color] * (num_segments + 1)
@@ -4,7 +4,7 @@
 import math
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-from pyglet.math import Mat4, Vec2, Vec3
+from pyglet.math import Mat4, Vec2
 
 import arcade
 
@@ -15,6 +15,14 @@
 FourIntTuple = Tuple[int, int, int, int]
 FourFloatTuple = Tuple[float, float, float, float]
 
+# Dirty bits marking which camera matrixes need to be recomputed
+_DIRTY_PROJECTION = 1
+_DIRTY_VIEW = 2
+_DIRTY_ROTATION = 4
+
+# Mat4 is immutable, so a single identity matrix can be shared by all cameras
+_IDENTITY_MATRIX = Mat4()
+
 
 class SimpleCamera:
     """
@@ -37,6 +45,9 @@ def __init__(self, *,
         # store the viewport and projection tuples
         # viewport is the space the camera will hold on the screen (left, bottom, width, height)
         self._viewport: FourIntTuple = viewport or (0, 0, self._window.width, self._window.height)
+        # reciprocals of half the viewport size, used to convert the position to normalized coordinates
+        self._inv_half_viewport_width: float = 2.0 / self._viewport[2]
+        self._inv_half_viewport_height: float = 2.0 / self._viewport[3]
 
         # projection is what you want to project into the camera viewport (left, right, bottom, top)
         self._projection: FourFloatTuple = projection or (0, self._window.width,
@@ -49,25 +60,50 @@ def __init__(self, *,
         # Matrixes
 
         # Projection Matrix is used to apply the camera viewport size
-        self._projection_matrix: Mat4 = Mat4()
+        self._projection_matrix: Mat4 = _IDENTITY_MATRIX
         # View Matrix is what the camera is looking at(position)
-        self._view_matrix: Mat4 = Mat4()
+        self._view_matrix: Mat4 = _IDENTITY_MATRIX
         # We multiply projection and view matrices to get combined,
         #  this is what actually gets sent to GL context
-        self._combined_matrix: Mat4 = Mat4()
+        self._combined_matrix: Mat4 = _IDENTITY_MATRIX
+
+        # The only non-constant values of the orthogonal projection and
+        # translation-only view matrixes, used to build the combined matrix
+        self._projection_scale_x: float = 1.0
+        self._projection_scale_y: float = 1.0
+        self._projection_scale_z: float = 1.0
+        self._projection_offset_x: float = 0.0
+        self._projection_offset_y: float = 0.0
+        self._projection_offset_z: float = 0.0
+        self._view_offset_x: float = 0.0
+        self._view_offset_y: float = 0.0
+
+        # Dirty bits
+        # Matrixes are only recomputed in update() when something affecting them changed
+        self._dirty: int = _DIRTY_PROJECTION | _DIRTY_VIEW
 
         # Position
-        self.position: Vec2 = Vec2(0, 0)
+        self._position: Vec2 = Vec2(0, 0)
 
         # Camera movement
         self.goal_position: Vec2 = Vec2(0, 0)
         self.move_speed: float = 1.0  # 1.0 is instant
         self.moving: bool = False
 
-        # Init matrixes
-        # This will precompute the projection, view and combined matrixes
-        self._set_projection_matrix(update_combined_matrix=False)
-        self._set_view_matrix()
+    @property
+    def position(self) -> Vec2:
+        """ The position of the camera """
+        return self._position
+
+    @position.setter
+    def position(self, position: Union[Vec2, tuple]) -> None:
+        """ Sets the position of the camera """
+        if not isinstance(position, Vec2):
+            position = Vec2(*position)
+        self._position = position
+
+        # the position affects the view matrix
+        self._dirty |= _DIRTY_VIEW
 
     @property
     def viewport_width(self) -> int:
@@ -92,9 +128,11 @@ def viewport(self, viewport: FourIntTuple) -> None:
     def set_viewport(self, viewport: FourIntTuple) -> None:
         """ Sets the viewport """
         self._viewport = viewport or (0, 0, self._window.width, self._window.height)
+        self._inv_half_viewport_width = 2.0 / self._viewport[2]
+        self._inv_half_viewport_height = 2.0 / self._viewport[3]
 
         # the viewport affects the view matrix
-        self._set_view_matrix()
+        self._dirty |= _DIRTY_VIEW
 
     @property
     def projection(self) -> FourFloatTuple:
@@ -111,7 +149,7 @@ def projection(self, new_projection: FourFloatTuple) -> None:
         projection based on the projection size of the camera and the zoom applied.
         """
         self._projection = new_projection or (0, self._window.width, 0, self._window.height)
-        self._set_projection_matrix()
+        self._dirty |= _DIRTY_PROJECTION
 
     @property
     def scale(self) -> Tuple[float, float]:
@@ -140,7 +178,7 @@ def scale(self, new_scale: Tuple[int, int]) -> None:
     @property
     def zoom(self) -> float:
         """ The zoom applied to the projection based on the width scale """
-        return self.scale[0]
+        return self.projection_to_viewport_width_ratio
 
     @zoom.setter
     def zoom(self, zoom: float) -> None:
@@ -167,36 +205,66 @@ def viewport_to_projection_height_ratio(self):
         """ The ratio of viewport height to projection height """
         return self.viewport_height / (self._projection[3] - self._projection[2])
 
-    def _set_projection_matrix(self, *, update_combined_matrix: bool = True) -> None:
-        """
-        Helper method. This will just precompute the projection and combined matrix
-
-        :param bool update_combined_matrix: if True will also update the combined matrix (projection @ view)
-        """
-        self._projection_matrix = Mat4.orthogonal_projection(*self._projection, -1, 1)
-        if update_combined_matrix:
-            self._set_combined_matrix()
+    def _set_projection_matrix(self) -> None:
+        """ Helper method. This will just precompute the projection matrix """
+        self._set_orthogonal_projection(-1, 1)
+
+    def _set_orthogonal_projection(self, near: float, far: float) -> None:
+        """ Helper method. Computes the projection matrix, same as Mat4.orthogonal_projection """
+        left, right, bottom, top = self._projection
+        width = right - left
+        height = top - bottom
+        depth = far - near
+
+        sx = self._projection_scale_x = 2.0 / width
+        sy = self._projection_scale_y = 2.0 / height
+        sz = self._projection_scale_z = -2.0 / depth
+        ox = self._projection_offset_x = -(right + left) / width
+        oy = self._projection_offset_y = -(top + bottom) / height
+        oz = self._projection_offset_z = -(far + near) / depth
+        self._projection_matrix = Mat4((
+            sx, 0.0, 0.0, 0.0,
+            0.0, sy, 0.0, 0.0,
+            0.0, 0.0, sz, 0.0,
+            ox, oy, oz, 1.0,
+        ))
+
+    def _set_view_matrix(self) -> None:
+        """ Helper method. This will just precompute the view matrix """
 
-    def _set_view_matrix(self, *, update_combined_matrix: bool = True) -> None:
-        """
-        Helper method. This will just precompute the view and combined matrix
+        # Figure out our 'real' position
+        result_x = self._position[0] * self._inv_half_viewport_width
+        result_y = self._position[1] * self._inv_half_viewport_height
 
-        :param bool update_combined_matrix: if True will also update the combined matrix (projection @ view)
-        """
+        # The zoom is already part of the projection matrix, so the view matrix
+        # is a pure translation and its inverse is simply the negated translation
+        self._view_offset_x = -result_x
+        self._view_offset_y = -result_y
 
-        # Figure out our 'real' position
-        result_position = Vec3(
-            (self.position[0] / (self.viewport_width / 2)),
-            (self.position[1] / (self.viewport_height / 2)),
-            0
-        )
-        self._view_matrix = ~(Mat4.from_translation(result_position))
-        if update_combined_matrix:
-            self._set_combined_matrix()
+        # Without a translation the view matrix is the identity
+        if result_x == 0.0 and result_y == 0.0:
+            self._view_matrix = _IDENTITY_MATRIX
+        else:
+            self._view_matrix = Mat4((
+                1.0, 0.0, 0.0, 0.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0,
+                -result_x, -result_y, 0.0, 1.0,
+            ))
 
     def _set_combined_matrix(self) -> None:
         """ Helper method. This will just precompute the combined matrix"""
-        self._combined_matrix = self._view_matrix @ self._projection_matrix
+        # The projection is orthogonal and the view is a pure translation, so
+        # view @ projection is the projection with the view translation added.
+        self._combined_matrix = Mat4((
+            self._projection_scale_x, 0.0, 0.0, 0.0,
+            0.0, self._projection_scale_y, 0.0, 0.0,
+            0.0, 0.0, self._projection_scale_z, 0.0,
+            self._projection_offset_x + self._view_offset_x,
+            self._projection_offset_y + self._view_offset_y,
+            self._projection_offset_z,
+            1.0,
+        ))
 
     def move_to(self, vector: Union[Vec2, tuple], speed: float = 1.0) -> None:
         """
@@ -224,20 +292,16 @@ def center(self, vector: Union[Vec2, tuple], speed: float = 1.0) -> None:
         """
         Centers the camera on coordinates
         """
-        if not isinstance(vector, Vec2):
-            vector = Vec2(*vector)
-
         # get the center of the camera viewport
-        center = Vec2(self.viewport_width, self.viewport_height) / 2
+        center_x = self.viewport_width / 2
+        center_y = self.viewport_height / 2
 
         # adjust vector to projection ratio
-        vector = Vec2(vector.x * self.viewport_to_projection_width_ratio,
-                      vector.y * self.viewport_to_projection_height_ratio)
+        x = vector[0] * self.viewport_to_projection_width_ratio
+        y = vector[1] * self.viewport_to_projection_height_ratio
 
         # move to the vector substracting the center
-        target = (vector - center)
-
-        self.move_to(target, speed)
+        self.move_to((x - center_x, y - center_y), speed)
 
     def get_map_coordinates(self, camera_vector: Union[Vec2, tuple]) -> Vec2:
         """
@@ -269,10 +333,42 @@ def update(self):
         """
         if self.moving:
             # Apply Goal Position
-            self.position = self.position.lerp(self.goal_position, self.move_speed)
-            if self.position == self.goal_position:
-                self.moving = False
-            self._set_view_matrix()  # this will alse set the combined matrix
+            self._move_to_goal()
+
+        # Only recompute the matrixes if something changed since the last update
+        if self._dirty:
+            self._update_matrices()
+
+    def _update_matrices(self) -> None:
+        """
+        Helper method. Recomputes the dirty matrixes once, in dependency order,
+        and finally the combined matrix.
+        """
+        dirty = self._dirty
+        if dirty & _DIRTY_PROJECTION:
+            self._set_projection_matrix()
+        if dirty & _DIRTY_VIEW:
+            self._set_view_matrix()
+        if dirty & (_DIRTY_PROJECTION | _DIRTY_VIEW):
+            self._set_combined_matrix()
+        self._dirty = 0
+
+    def _move_to_goal(self) -> None:
+        """ Helper method. Lerps the position towards the goal position """
+        goal_x = self.goal_position[0]
+        goal_y = self.goal_position[1]
+        x = self._position.x + (goal_x - self._position.x) * self.move_speed
+        y = self._position.y + (goal_y - self._position.y) * self.move_speed
+
+        # Snap to the goal once we are a tiny fraction of a pixel away from it
+        dx = goal_x - x
+        dy = goal_y - y
+        if dx * dx + dy * dy < 1e-6:
+            x = goal_x
+            y = goal_y
+            self.moving = False
+
+        self.position = Vec2(x, y)
 
     def use(self) -> None:
         """
@@ -317,8 +413,11 @@ def __init__(
         self._far: int = 1
 
         # Shake
-        self.shake_velocity: Vec2 = Vec2()
-        self.shake_offset: Vec2 = Vec2()
+        # Stored as plain floats to avoid creating vectors every frame
+        self._shake_velocity_x: float = 0.0
+        self._shake_velocity_y: float = 0.0
+        self._shake_offset_x: float = 0.0
+        self._shake_offset_y: float = 0.0
         self.shake_speed: float = 0.0
         self.shake_damping: float = 0.0
         self.shaking: bool = False
@@ -328,54 +427,79 @@ def __init__(
 
         # Rotation
         self._rotation: float = rotation  # in degrees
+        # Cosine and sine of the rotation, only recomputed when the rotation changes
+        self._rotation_cos: float = math.cos(math.radians(rotation))
+        self._rotation_sin: float = math.sin(math.radians(rotation))
         self._anchor: Optional[Tuple[float, float]] = anchor  # (x, y) to anchor the camera rotation
 
         # Matrixes
         # Rotation matrix holds the matrix used to compute the
         #  rotation set in window.ctx.view_matrix_2d
-        self._rotation_matrix: Mat4 = Mat4()
+        self._rotation_matrix: Mat4 = _IDENTITY_MATRIX
+        self._dirty |= _DIRTY_ROTATION
 
         # apply provided zoom
         if zoom != 1.0:
             self.zoom = zoom
 
-        # Init matrixes
-        # This will precompute the rotation matrix
-        self._set_rotation_matrix()
-
     def set_viewport(self, viewport: FourIntTuple) -> None:
         """ Sets the viewport """
         super().set_viewport(viewport)
 
         # the viewport affects the rotation matrix if the rotation anchor is not set
         if self._anchor is None:
-            self._set_rotation_matrix()
+            self._dirty |= _DIRTY_ROTATION
 
-    def _set_projection_matrix(self, *, update_combined_matrix: bool = True) -> None:
-        """
-        Helper method. This will just precompute the projection and combined matrix
-
-        :param bool update_combined_matrix: if True will also update the combined matrix (projection @ view)
-        """
-        self._projection_matrix = Mat4.orthogonal_projection(*self._projection, self._near, self._far)
-        if update_combined_matrix:
-            self._set_combined_matrix()
+    def _set_projection_matrix(self) -> None:
+        """ Helper method. This will just precompute the projection matrix """
+        self._set_orthogonal_projection(self._near, self._far)
 
     def _set_rotation_matrix(self) -> None:
         """ Helper method that computes the rotation_matrix every time is needed """
-        rotate = Mat4.from_rotation(math.radians(self._rotation), Vec3(0, 0, 1))
+        cos_angle = self._rotation_cos
+        sin_angle = self._rotation_sin
+
+        # Without a rotation the anchor doesn't matter and the matrix is the identity
+        if sin_angle == 0.0 and cos_angle == 1.0:
+            self._rotation_matrix = _IDENTITY_MATRIX
+            return
 
         # If no anchor is set, use the center of the screen
         if self._anchor is None:
-            offset = Vec3(self.position.x, self.position.y, 0)
-            offset += Vec3(self.viewport_width / 2, self.viewport_height / 2, 0)
+            offset_x = self._position[0] + self.viewport_width / 2
+            offset_y = self._position[1] + self.viewport_height / 2
         else:
-            offset = Vec3(self._anchor[0], self._anchor[1], 0)
+            offset_x, offset_y = self._anchor
+
+        # This is translate(-offset) @ rotate @ translate(offset) folded into a single matrix
+        self._rotation_matrix = Mat4((
+            cos_angle, sin_angle, 0.0, 0.0,
+            -sin_angle, cos_angle, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            cos_angle * offset_x - sin_angle * offset_y - offset_x,
+            sin_angle * offset_x + cos_angle * offset_y - offset_y,
+            0.0, 1.0,
+        ))
+
+    @property
+    def shake_velocity(self) -> Vec2:
+        """ The current velocity of the camera shake """
+        return Vec2(self._shake_velocity_x, self._shake_velocity_y)
+
+    @shake_velocity.setter
+    def shake_velocity(self, velocity: Union[Vec2, tuple]) -> None:
+        self._shake_velocity_x = velocity[0]
+        self._shake_velocity_y = velocity[1]
 
-        translate_pre = Mat4.from_translation(offset)
-        translate_post = Mat4.from_translation(-offset)
+    @property
+    def shake_offset(self) -> Vec2:
+        """ The current offset of the camera shake """
+        return Vec2(self._shake_offset_x, self._shake_offset_y)
 
-        self._rotation_matrix = translate_post @ rotate @ translate_pre
+    @shake_offset.setter
+    def shake_offset(self, offset: Union[Vec2, tuple]) -> None:
+        self._shake_offset_x = offset[0]
+        self._shake_offset_y = offset[1]
 
     @property
     def near(self) -> int:
@@ -389,7 +513,7 @@ def near(self, near: int) -> None:
         projection based on the projection size of the camera and the zoom applied.
         """
         self._near = near
-        self._set_projection_matrix()
+        self._dirty |= _DIRTY_PROJECTION
 
     @property
     def far(self) -> int:
@@ -403,7 +527,7 @@ def far(self, far: int) -> None:
         projection based on the projection size of the camera and the zoom applied.
         """
         self._far = far
-        self._set_projection_matrix()
+        self._dirty |= _DIRTY_PROJECTION
 
     @property
     def rotation(self) -> float:
@@ -418,7 +542,10 @@ def rotation(self) -> float:
     @rotation.setter
     def rotation(self, value: float) -> None:
         self._rotation = value
-        self._set_rotation_matrix()
+        angle = math.radians(value)
+        self._rotation_cos = math.cos(angle)
+        self._rotation_sin = math.sin(angle)
+        self._dirty |= _DIRTY_ROTATION
 
     @property
     def anchor(self) -> Optional[Tuple[float, float]]:
@@ -445,61 +572,69 @@ def anchor(self, anchor: Optional[Tuple[float, float]]) -> None:
             self._anchor = None
         else:
             self._anchor = anchor[0], anchor[1]
-        self._set_rotation_matrix()
+        self._dirty |= _DIRTY_ROTATION
 
     def update(self) -> None:
         """
         Update the camera's viewport to the current settings.
         """
-        update_view_matrix = False
-
         if self.moving:
             # Apply Goal Position
-            self.position = self.position.lerp(self.goal_position, self.move_speed)
-            if self.position == self.goal_position:
-                self.moving = False
-            update_view_matrix = True
+            self._move_to_goal()
 
         if self.shaking:
             # Apply Camera Shake
 
-            # Move our offset based on shake velocity
-            self.shake_offset += self.shake_velocity
-
             # Get x and ys
-            vx = self.shake_velocity[0]
-            vy = self.shake_velocity[1]
+            vx = self._shake_velocity_x
+            vy = self._shake_velocity_y
 
-            ox = self.shake_offset[0]
-            oy = self.shake_offset[1]
-
-            # Calculate the angle our offset is at, and how far out
-            angle = math.atan2(ox, oy)
-            distance = arcade.get_distance(0, 0, ox, oy)
-            velocity_mag = arcade.get_distance(0, 0, vx, vy)
-
-            # Ok, what's the reverse? Pull it back in.
-            reverse_speed = min(self.shake_speed, distance)
-            opposite_angle = angle + math.pi
-            opposite_vector = Vec2(
-                math.sin(opposite_angle) * reverse_speed,
-                math.cos(opposite_angle) * reverse_speed,
-            )
+            # Move our offset based on shake velocity
+            ox = self._shake_offset_x + vx
+            oy = self._shake_offset_y + vy
 
             # Shaking almost done? Zero it out
-            if velocity_mag < self.shake_speed and distance < self.shake_speed:
-                self.shake_velocity = Vec2(0, 0)
-                self.shake_offset = Vec2(0, 0)
+            # Squared lengths are compared so the end of a shake needs no square roots
+            speed_squared = self.shake_speed * self.shake_speed
+            if vx * vx + vy * vy < speed_squared and ox * ox + oy * oy < speed_squared:
+                self._shake_velocity_x = self._shake_velocity_y = 0.0
+                self._shake_offset_x = self._shake_offset_y = 0.0
                 self.shaking = False
-
-            # Come up with a new velocity, pulled by opposite vector and damped
-            self.shake_velocity += opposite_vector
-            self.shake_velocity *= self.shake_damping
-
-            update_view_matrix = True
-
-        if update_view_matrix:
-            self._set_view_matrix()  # this will also set the combined matrix
+            else:
+                # Ok, what's the reverse? Pull it back in.
+                # This is the offset direction flipped and scaled to the reverse speed.
+                distance = math.hypot(ox, oy)
+                if distance > 0:
+                    reverse_scale = min(self.shake_speed, distance) / distance
+                    opposite_x = -ox * reverse_scale
+                    opposite_y = -oy * reverse_scale
+                else:
+                    opposite_x = opposite_y = 0.0
+
+                # Come up with a new velocity, pulled by opposite vector and damped
+                self._shake_velocity_x = (vx + opposite_x) * self.shake_damping
+                self._shake_velocity_y = (vy + opposite_y) * self.shake_damping
+                self._shake_offset_x = ox
+                self._shake_offset_y = oy
+
+            self._dirty |= _DIRTY_VIEW
+
+        # Without an anchor the rotation follows the camera position
+        if self._dirty & _DIRTY_VIEW and self._anchor is None:
+            self._dirty |= _DIRTY_ROTATION
+
+        # Only recompute the matrixes if something changed since the last update
+        if self._dirty:
+            self._update_matrices()
+
+    def _update_matrices(self) -> None:
+        """
+        Helper method. Recomputes the dirty matrixes once,
+        including the rotation matrix.
+        """
+        if self._dirty & _DIRTY_ROTATION:
+            self._set_rotation_matrix()
+        super()._update_matrices()
 
     def shake(self, velocity: Union[Vec2, tuple], speed: float = 1.5, damping: float = 0.9) -> None:
         """
@@ -509,10 +644,8 @@ def shake(self, velocity: Union[Vec2, tuple], speed: float = 1.5, damping: float
         :param float speed: How fast to shake
         :param float damping: How fast to stop shaking
         """
-        if not isinstance(velocity, Vec2):
-            velocity = Vec2(*velocity)
-
-        self.shake_velocity += velocity
+        self._shake_velocity_x += velocity[0]
+        self._shake_velocity_y += velocity[1]
         self.shake_speed = speed
         self.shake_damping = damping
         self.shaking = True
@@ -22,7 +22,7 @@
 from arcade import Color
 from arcade import PointList
 from arcade import earclip
-from .geometry_generic import rotate_point
+from .geometry_generic import rotate_points
 from arcade import get_four_byte_color
 from arcade import get_points_for_thick_line
 from arcade import Texture
@@ -68,7 +68,7 @@ def draw_arc_filled(center_x: float, center_y: float,
     if tilt_angle == 0:
         uncentered_point_list = unrotated_point_list
     else:
-        uncentered_point_list = [rotate_point(point[0], point[1], 0, 0, tilt_angle) for point in unrotated_point_list]
+        uncentered_point_list = rotate_points(unrotated_point_list, 0, 0, tilt_angle)
 
     point_list = [(point[0] + center_x, point[1] + center_y) for point in uncentered_point_list]
 
@@ -121,7 +121,7 @@ def draw_arc_outline(center_x: float, center_y: float, width: float,
     if tilt_angle == 0:
         uncentered_point_list = unrotated_point_list
     else:
-        uncentered_point_list = [rotate_point(point[0], point[1], 0, 0, tilt_angle) for point in unrotated_point_list]
+        uncentered_point_list = rotate_points(unrotated_point_list, 0, 0, tilt_angle)
 
     point_list = [(point[0] + center_x, point[1] + center_y) for point in uncentered_point_list]
 
@@ -691,11 +691,7 @@ def draw_rectangle_outline(center_x: float, center_y: float, width: float,
     point_list: PointList = (o_lt, i_lt, o_rt, i_rt, o_rb, i_rb, o_lb, i_lb, o_lt, i_lt)
 
     if tilt_angle != 0:
-        point_list_2 = []
-        for point in point_list:
-            new_point = rotate_point(point[0], point[1], center_x, center_y, tilt_angle)
-            point_list_2.append(new_point)
-        point_list = point_list_2
+        point_list = rotate_points(point_list, center_x, center_y, tilt_angle)
 
     _generic_draw_line_strip(point_list, color, gl.GL_TRIANGLE_STRIP)
 
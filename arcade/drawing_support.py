@@ -174,13 +174,21 @@ def color_from_hex_string(code: str) -> RGBA:
     """
     code = code.lstrip("#")
     if len(code) <= 4:
-        code = "".join(i * 2 for i in code)
-
-    if len(code) == 6:
-        # full opacity if no alpha specified
-        return int(code[:2], 16), int(code[2:4], 16), int(code[4:6], 16), 255
-    elif len(code) == 8:
-        return int(code[:2], 16), int(code[2:4], 16), int(code[4:6], 16), int(code[6:8], 16)
+        code = "".join([i + i for i in code])
+
+    # bytes.fromhex validates and decodes every channel pair in one call
+    try:
+        data = bytes.fromhex(code)
+    except ValueError:
+        data = b""
+
+    # fromhex skips whitespace, so make sure every character was a digit
+    if len(data) * 2 == len(code):
+        if len(data) == 3:
+            # full opacity if no alpha specified
+            return data[0], data[1], data[2], 255
+        elif len(data) == 4:
+            return data[0], data[1], data[2], data[3]
 
     raise ValueError(f"Improperly formatted color: '{code}'")
 
@@ -1,5 +1,7 @@
 import math
-from typing import Tuple
+from typing import List, Tuple
+
+from arcade.arcade_types import Point, PointList
 
 
 def get_distance(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -55,6 +57,40 @@ def rotate_point(
     return x, y
 
 
+def rotate_points(
+    points: PointList,
+    cx: float,
+    cy: float,
+    angle_degrees: float,
+) -> List[Point]:
+    """
+    Rotate a list of points around a center.
+
+    Gives the same results as calling :py:func:`rotate_point` on each
+    point, but only computes the sine and cosine of the angle once.
+
+    :param points: Points you want to rotate
+    :param cx: x value of the center point you want to rotate around
+    :param cy: y value of the center point you want to rotate around
+    :param angle_degrees: Angle, in degrees, to rotate
+    :return: List of rotated (x, y) pairs
+    """
+    if angle_degrees == 0:
+        return [(round(float(x), 2), round(float(y), 2)) for x, y in points]
+
+    angle_radians = math.radians(angle_degrees)
+    cos_angle = math.cos(angle_radians)
+    sin_angle = math.sin(angle_radians)
+
+    return [
+        (
+            round((x - cx) * cos_angle - (y - cy) * sin_angle + cx, 2),
+            round((x - cx) * sin_angle + (y - cy) * cos_angle + cy, 2),
+        )
+        for x, y in points
+    ]
+
+
 def get_angle_degrees(x1: float, y1: float, x2: float, y2: float) -> float:
     """
     Get the angle in degrees between two points.
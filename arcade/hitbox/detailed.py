@@ -83,6 +83,8 @@ def trace_image(self, image: Image) -> PolylineSet:
         :param Image image: Image to trace.
         :return: Line sets
         """
+        pixels = image.load()
+
         def sample_func(sample_point: Point) -> int:
             """ Method used to sample image. """
             if sample_point[0] < 0 \
@@ -91,8 +93,7 @@ def sample_func(sample_point: Point) -> int:
                     or sample_point[1] >= image.height:
                 return 0
 
-            point_tuple = int(sample_point[0]), int(sample_point[1])
-            color = image.getpixel(point_tuple)
+            color = pixels[int(sample_point[0]), int(sample_point[1])]
             return 255 if color[3] > 0 else 0
 
         # Do a quick check if it is a full tile
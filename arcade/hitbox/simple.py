@@ -30,6 +30,9 @@ def calculate(self, image: Image, **kwargs) -> PointList:
         if bbox is None:
             return tuple()
 
+        # PixelAccess avoids a getpixel call per sample
+        pixels = image.load()
+
         left_border, top_border, right_border, bottom_border = bbox
         right_border -= 1
         bottom_border -= 1
@@ -41,7 +44,7 @@ def _check_corner_offset(start_x: int, start_y: int, x_direction: int, y_directi
                 y = start_y + (offset * y_direction)
                 x = start_x
                 for _ in range(offset + 1):
-                    alpha = image.getpixel((x, y))
+                    alpha = pixels[x, y]
                     # print(f"({x}, {y}) = {my_pixel} | ", end="")
                     if alpha != 0:
                         bad = True
@@ -7,6 +7,7 @@
 
 import math
 import dataclasses
+from weakref import WeakValueDictionary
 from typing import (
     Any,
     Tuple,
@@ -14,23 +15,24 @@
     Dict,
     List,
     Optional,
+    Sequence,
     TYPE_CHECKING,
 )
 import PIL.Image
 
 import arcade
-from arcade.geometry_generic import get_angle_degrees
+from arcade.geometry_generic import get_angle_degrees, get_distance
 from arcade import load_texture
 from arcade import Texture
-from arcade import rotate_point
 from arcade import make_soft_circle_texture
 from arcade import make_circle_texture
 from arcade import Color
+from arcade import get_four_byte_color as _get_four_byte_color
 from arcade.color import BLACK
 from arcade.resources import resolve_resource_path
 from arcade.arcade_types import RGBA, Point, PointList
 from arcade.cache import build_cache_name
-from arcade.texture import SolidColorTexture
+from arcade.texture import ImageData, SolidColorTexture
 
 if TYPE_CHECKING:  # handle import cycle caused by type hinting
     from arcade.sprite_list import SpriteList
@@ -40,6 +42,12 @@
 FACE_UP = 3
 FACE_DOWN = 4
 
+# SolidColorTexture instances shared by SpriteSolidColor, keyed by (width, height).
+# Entries are dropped once no sprite uses that size anymore.
+_solid_color_textures: "WeakValueDictionary[Tuple[float, float], SolidColorTexture]" = WeakValueDictionary()
+# Texture.cache names of the white SpriteCircle textures, keyed by (diameter, soft)
+_circle_texture_names: Dict[Tuple[int, bool], str] = {}
+
 
 class PyMunk:
     """Object used to hold pymunk info for a sprite."""
@@ -397,24 +405,32 @@ def get_adjusted_hit_box(self) -> PointList:
         if self._point_list_cache is not None:
             return self._point_list_cache
 
-        def _adjust_point(point) -> Point:
-            # Rotate the point if needed
-            if self._angle:
-                # Rotate with scaling to not distort it if scale x and y is different
-                point = rotate_point(point[0] * self._scale[0], point[1] * self._scale[1], 0, 0, self._angle)
-                # Apply position
-                return (
-                    point[0] + self._position[0],
-                    point[1] + self._position[1],
+        # Bind everything used per point to locals to keep the loops cheap
+        scale_x, scale_y = self._scale
+        position_x, position_y = self._position
+
+        if self._angle:
+            # The rotation is the same for all points, so compute it only once
+            angle_radians = math.radians(self._angle)
+            cos_angle = math.cos(angle_radians)
+            sin_angle = math.sin(angle_radians)
+
+            # Rotate with scaling to not distort it if scale x and y is different,
+            # then apply position. Rounding matches rotate_point.
+            self._point_list_cache = tuple(
+                (
+                    round(x * scale_x * cos_angle - y * scale_y * sin_angle, 2) + position_x,
+                    round(x * scale_x * sin_angle + y * scale_y * cos_angle, 2) + position_y,
                 )
+                for x, y in self.hit_box
+            )
+        else:
             # Apply position and scale
-            return (
-                point[0] * self._scale[0] + self._position[0],
-                point[1] * self._scale[1] + self._position[1],
+            self._point_list_cache = tuple(
+                (x * scale_x + position_x, y * scale_y + position_y)
+                for x, y in self.hit_box
             )
 
-        # Cache the results
-        self._point_list_cache = tuple(_adjust_point(point) for point in self.hit_box)
         return self._point_list_cache
 
     def forward(self, speed: float = 1.0) -> None:
@@ -1405,23 +1421,31 @@ class SpriteSolidColor(Sprite):
     A rectangular sprite of the given ``width``, ``height``, and ``color``.
 
     The texture is automatically generated instead of loaded from a
-    file. Internally only a single global texture is used for this
-    sprite type, so concerns about memory usage non-existent regardless
-    of size or number of sprite variations.
+    file. All sprites of this type share a single 32x32 white image,
+    so it only takes up one entry in the texture atlas. Each size gets
+    its own lightweight texture wrapping that image, which is shared
+    by every sprite of that size.
 
     :param int width: Width of the sprite in pixels
     :param int height: Height of the sprite in pixels
     :param Color color: The color of the sprite as an RGB or RGBA tuple
     """
     _default_image = PIL.Image.new("RGBA", (32, 32), (255, 255, 255, 255))
+    # Shared by the texture for every size so the image is only hashed once
+    _default_image_data = ImageData(_default_image)
 
     def __init__(self, width: int, height: int, color: Color):
         """
         Create a solid-color rectangular sprite.
         """
         super().__init__()
-        self.texture = SolidColorTexture("sprite_solid_color", width, height, self._default_image)
-        self._color = arcade.get_four_byte_color(color)
+        key = (width, height)
+        texture = _solid_color_textures.get(key)
+        if texture is None:
+            texture = SolidColorTexture("sprite_solid_color", width, height, self._default_image_data)
+            _solid_color_textures[key] = texture
+        self.texture = texture
+        self._color = _get_four_byte_color(color)
 
 
 class SpriteCircle(Sprite):
@@ -1434,7 +1458,8 @@ class SpriteCircle(Sprite):
     There may be a stutter the first time a combination of ``radius``,
     ``color``, and ``soft`` is used due to texture generation. All
     subsequent calls for the same combination will run faster because
-    they will re-use the texture generated earlier.
+    they will re-use the texture generated earlier. Use :py:meth:`prewarm`
+    to generate the textures ahead of time, such as on a loading screen.
 
     For a gradient fill instead of a solid color, set ``soft`` to
     ``True``. The circle will fade from an opaque center to transparent
@@ -1447,24 +1472,99 @@ class SpriteCircle(Sprite):
     """
     def __init__(self, radius: int, color: Color, soft: bool = False):
         super().__init__()
-        radius = int(radius)
-        diameter = radius * 2
-        color_rgba = arcade.get_four_byte_color(color)
+        # Most callers already pass an int, so only convert other types
+        if type(radius) is not int:
+            radius = int(radius)
+        color_rgba = _get_four_byte_color(color)
+        texture = self._get_texture(radius * 2, soft)
+
+        # apply results to the new sprite
+        self.texture = texture
+        self.color = color_rgba
+        self._points = self.texture.hit_box_points
+
+    @classmethod
+    def bulk_create(
+        cls,
+        radii: Sequence[int],
+        colors: Sequence[Color],
+        soft: bool = False,
+    ) -> List["SpriteCircle"]:
+        """
+        Create one circle for each ``radius`` and ``color`` pair.
+
+        This is faster than creating the circles one by one when spawning
+        many of them, such as for particles, because the texture for each
+        distinct radius is only looked up once.
+
+        .. note:: The sprites are set up directly rather than through
+                  ``__init__``, so subclasses overriding ``__init__``
+                  should create their instances individually.
+
+        :param radii: Radius of each circle in pixels
+        :param colors: Color of each circle as an RGB or RGBA tuple
+        :param bool soft: If ``True``, the circles will fade from an opaque
+                          center to transparent edges.
+        :return: List of new circles in the same order as the input
+        :raises ValueError: if ``radii`` and ``colors`` have different lengths
+        """
+        if len(radii) != len(colors):
+            raise ValueError(
+                f"Got {len(radii)} radii but {len(colors)} colors, they must have the same length"
+            )
 
+        textures: Dict[int, Texture] = {}
+        sprites = []
+        for radius, color in zip(radii, colors):
+            radius = int(radius)
+            texture = textures.get(radius)
+            if texture is None:
+                texture = cls._get_texture(radius * 2, soft)
+                textures[radius] = texture
+
+            sprite = cls.__new__(cls)
+            Sprite.__init__(sprite)
+            sprite.texture = texture
+            sprite.color = _get_four_byte_color(color)
+            sprite._points = texture.hit_box_points
+            sprites.append(sprite)
+
+        return sprites
+
+    @classmethod
+    def prewarm(cls, radii: Iterable[int], soft_variants: Iterable[bool] = (False, True)) -> None:
+        """
+        Generate the textures for the given radii without creating any sprites.
+
+        Circles created later with these radii will reuse the textures
+        instead of generating them on first use.
+
+        :param radii: Radii of the circles in pixels
+        :param soft_variants: Which of the hard (``False``) and soft (``True``)
+                              textures to generate for each radius
+        """
+        soft_variants = tuple(soft_variants)
+        for radius in radii:
+            for soft in soft_variants:
+                cls._get_texture(int(radius) * 2, soft)
+
+    @staticmethod
+    def _get_texture(diameter: int, soft: bool) -> Texture:
+        """Get the shared white circle texture, creating it if needed."""
         # NOTE: We are only creating white textures. The actual color is
         #       is applied in the shader through the sprite's color attribute.
-        # determine the texture's cache name.
-        if soft:
-            cache_name = build_cache_name("circle_texture_soft", diameter, 255, 255, 255, 255)
-        else:
-            cache_name = build_cache_name("circle_texture", diameter, 255, 255, 255, 255)
-
-        # use the named texture if it was already made
-        if cache_name in Texture.cache:  # type: ignore
-            texture = Texture.cache[cache_name]  # type: ignore
+        cache_key = (diameter, bool(soft))
+        cache_name = _circle_texture_names.get(cache_key)
+        if cache_name is None:
+            if soft:
+                cache_name = build_cache_name("circle_texture_soft", diameter, 255, 255, 255, 255)
+            else:
+                cache_name = build_cache_name("circle_texture", diameter, 255, 255, 255, 255)
+            _circle_texture_names[cache_key] = cache_name
 
         # generate the texture if it's not in the cache
-        else:
+        texture = Texture.cache.get(cache_name)  # type: ignore
+        if texture is None:
             if soft:
                 texture = make_soft_circle_texture(diameter, (255, 255, 255, 255), name=cache_name)
             else:
@@ -1472,10 +1572,7 @@ def __init__(self, radius: int, color: Color, soft: bool = False):
 
             Texture.cache[cache_name] = texture  # type: ignore
 
-        # apply results to the new sprite
-        self.texture = texture
-        self.color = color_rgba
-        self._points = self.texture.hit_box_points
+        return texture
 
 
 def get_distance_between_sprites(sprite1: Sprite, sprite2: Sprite) -> float:
@@ -1487,4 +1584,4 @@ def get_distance_between_sprites(sprite1: Sprite, sprite2: Sprite) -> float:
     :return: Distance
     :rtype: float
     """
-    return arcade.get_distance(*sprite1._position, *sprite2._position)
+    return get_distance(*sprite1._position, *sprite2._position)
@@ -8,8 +8,8 @@
 from copy import copy
 from typing import Dict, List, Tuple, Type
 from enum import Enum
-import arcade
 from arcade.arcade_types import PointList
+from arcade.geometry_generic import rotate_points
 
 
 class VertexOrder(Enum):
@@ -100,7 +100,7 @@ class Rotate90Transform(Transform):
     def transform_hit_box_points(
         points: PointList,
     ) -> PointList:
-        return tuple(arcade.rotate_point(point[0], point[1], 0, 0, 90) for point in points)
+        return tuple(rotate_points(points, 0, 0, 90))
 
 
 class Rotate180Transform(Transform):
@@ -118,7 +118,7 @@ class Rotate180Transform(Transform):
     def transform_hit_box_points(
         points: PointList,
     ) -> PointList:
-        return tuple(arcade.rotate_point(point[0], point[1], 0, 0, 180) for point in points)
+        return tuple(rotate_points(points, 0, 0, 180))
 
 
 class Rotate270Transform(Transform):
@@ -136,7 +136,7 @@ class Rotate270Transform(Transform):
     def transform_hit_box_points(
         points: PointList,
     ) -> PointList:
-        return tuple(arcade.rotate_point(point[0], point[1], 0, 0, 270) for point in points)
+        return tuple(rotate_points(points, 0, 0, 270))
 
 
 class FlipLeftToRightTransform(Transform):
@@ -0,0 +1,140 @@
+import math
+
+import pytest
+from pyglet.math import Mat4, Vec2, Vec3
+
+import arcade
+
+
+def reference_combined_matrix(camera):
+    """Combined matrix built the slow way with pyglet's matrix helpers"""
+    projection = Mat4.orthogonal_projection(*camera.projection, camera.near, camera.far)
+    position = Vec3(
+        camera.position[0] / (camera.viewport_width / 2),
+        camera.position[1] / (camera.viewport_height / 2),
+        0,
+    )
+    view = ~Mat4.from_translation(position)
+    return view @ projection
+
+
+def reference_rotation_matrix(camera):
+    """Rotation matrix built the slow way with pyglet's matrix helpers"""
+    rotate = Mat4.from_rotation(math.radians(camera.rotation), Vec3(0, 0, 1))
+    if camera.anchor is None:
+        offset = Vec3(
+            camera.position[0] + camera.viewport_width / 2,
+            camera.position[1] + camera.viewport_height / 2,
+            0,
+        )
+    else:
+        offset = Vec3(camera.anchor[0], camera.anchor[1], 0)
+    return Mat4.from_translation(-offset) @ rotate @ Mat4.from_translation(offset)
+
+
+def assert_matrices(camera):
+    camera.update()
+    assert camera._combined_matrix == pytest.approx(reference_combined_matrix(camera))
+    assert camera._rotation_matrix == pytest.approx(reference_rotation_matrix(camera))
+
+
+def test_camera_matrices(window: arcade.Window):
+    camera = arcade.Camera(viewport=(0, 0, 800, 600))
+    assert_matrices(camera)
+
+    camera.zoom = 2.0
+    assert_matrices(camera)
+
+    camera.move((120, -40))
+    assert_matrices(camera)
+
+    camera.resize(400, 300)
+    assert_matrices(camera)
+
+    camera.viewport = (10, 20, 640, 480)
+    assert_matrices(camera)
+
+    camera.near = -10
+    camera.far = 20
+    assert_matrices(camera)
+
+    camera.rotation = 30.0
+    assert_matrices(camera)
+
+    camera.anchor = (50, 75)
+    assert_matrices(camera)
+
+    camera.rotation = -135.0
+    camera.zoom = 0.5
+    assert_matrices(camera)
+
+    camera.anchor = None
+    assert_matrices(camera)
+
+
+def test_camera_rotation_pivot_follows_position(window: arcade.Window):
+    camera = arcade.Camera(viewport=(0, 0, 800, 600), rotation=45.0)
+    camera.update()
+    before = camera._rotation_matrix
+
+    # Without an anchor the camera rotates around the center of what it sees
+    camera.move((100, 50))
+    assert_matrices(camera)
+    assert camera._rotation_matrix != pytest.approx(before)
+
+    # An anchor pins the pivot no matter where the camera moves
+    camera.anchor = (0, 0)
+    camera.update()
+    anchored = camera._rotation_matrix
+    camera.move((300, 200))
+    assert_matrices(camera)
+    assert camera._rotation_matrix == pytest.approx(anchored)
+
+
+def test_camera_position_assignment(window: arcade.Window):
+    camera = arcade.Camera(viewport=(0, 0, 800, 600), rotation=10.0)
+    camera.position = (30, 40)
+    assert camera.position == Vec2(30, 40)
+
+    try:
+        camera.use()
+        assert window.ctx.projection_2d_matrix == pytest.approx(reference_combined_matrix(camera))
+        assert window.view == pytest.approx(reference_rotation_matrix(camera))
+    finally:
+        # The window is shared between tests, so drop the camera rotation again
+        window.ctx.view_matrix_2d = Mat4()
+        window.current_camera = None
+
+
+def test_camera_shake_ends(window: arcade.Window):
+    camera = arcade.Camera(viewport=(0, 0, 800, 600))
+
+    # A shake slower than its speed stops on the next update
+    camera.shake((0.5, 0.5), speed=1.5)
+    camera.update()
+    assert not camera.shaking
+    assert camera.shake_velocity == Vec2(0, 0)
+    assert camera.shake_offset == Vec2(0, 0)
+
+    # A strong shake is pulled back and eventually zeroed out
+    camera.shake((10, -8))
+    for _ in range(1000):
+        camera.update()
+        if not camera.shaking:
+            break
+    assert not camera.shaking
+    assert camera.shake_velocity == Vec2(0, 0)
+    assert camera.shake_offset == Vec2(0, 0)
+
+
+def test_camera_move_to_snaps_to_goal(window: arcade.Window):
+    camera = arcade.Camera(viewport=(0, 0, 800, 600))
+    camera.move_to((100, 50), speed=0.5)
+    for _ in range(30):
+        camera.update()
+        if not camera.moving:
+            break
+
+    assert not camera.moving
+    assert camera.position == Vec2(100, 50)
+    assert_matrices(camera)
@@ -49,36 +49,52 @@ def test_rotate_point():
     assert ry == 10
 
 
-def test_parse_color():
+def test_rotate_points():
+    points = [(0, 0), (50, 50), (50, 0), (20, 10)]
+    assert arcade.rotate_points(points, 0, 0, 0) == [(0, 0), (50, 50), (50, 0), (20, 10)]
+    assert arcade.rotate_points(points, 0, 0, 90) == [(0, 0), (-50, 50), (0, 50), (-10, 20)]
+    assert arcade.rotate_points(points, 10, 10, 180) == [(20, 20), (-30, -30), (-30, 20), (0, 10)]
+
+    # Matches rotating each point on its own
+    assert arcade.rotate_points(points, 3, -7, 33) == [
+        arcade.rotate_point(x, y, 3, -7, 33) for x, y in points
+    ]
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    (
+        # Hash symbol RGBA variants
+        ("#ffffffff", (255, 255, 255, 255)),
+        ("#ffffff00", (255, 255, 255, 0)),
+        ("#ffff00ff", (255, 255, 0, 255)),
+        ("#ff00ffff", (255, 0, 255, 255)),
+        ("#00ffffff", (0, 255, 255, 255)),
+        # RGB
+        ("#ffffff", (255, 255, 255, 255)),
+        ("#ffff00", (255, 255, 0, 255)),
+        ("#ff0000", (255, 0, 0, 255)),
+        # Without hash
+        ("ffffff", (255, 255, 255, 255)),
+        ("ffff00", (255, 255, 0, 255)),
+        ("ff0000", (255, 0, 0, 255)),
+        # Short form
+        ("#fff", (255, 255, 255, 255)),
+        ("FFF", (255, 255, 255, 255)),
+        ("#f008", (255, 0, 0, 136)),
+    )
+)
+def test_parse_color(code, expected):
+    assert arcade.color_from_hex_string(code) == expected
+
+
+@pytest.mark.parametrize(
+    "code",
+    ("#ff0000ff0", "ppp", "ff", "", "#", "ff 00 ff"),
+)
+def test_parse_color_invalid(code):
     with pytest.raises(ValueError):
-        arcade.color_from_hex_string("#ff0000ff0")
-
-    # Hash symbol RGBA variants
-    assert arcade.color_from_hex_string("#ffffffff") == (255, 255, 255, 255)
-    assert arcade.color_from_hex_string("#ffffff00") == (255, 255, 255, 0)
-    assert arcade.color_from_hex_string("#ffff00ff") == (255, 255, 0, 255)
-    assert arcade.color_from_hex_string("#ff00ffff") == (255, 0, 255, 255)
-    assert arcade.color_from_hex_string("#00ffffff") == (0, 255, 255, 255)
-
-    # RGB
-    assert arcade.color_from_hex_string("#ffffff") == (255, 255, 255, 255)
-    assert arcade.color_from_hex_string("#ffff00") == (255, 255, 0, 255)
-    assert arcade.color_from_hex_string("#ff0000") == (255, 0, 0, 255)
-
-    # Without hash
-    assert arcade.color_from_hex_string("ffffff") == (255, 255, 255, 255)
-    assert arcade.color_from_hex_string("ffff00") == (255, 255, 0, 255)
-    assert arcade.color_from_hex_string("ff0000") == (255, 0, 0, 255)
-
-    # Short form
-    assert arcade.color_from_hex_string("#fff") == (255, 255, 255, 255)
-    assert arcade.color_from_hex_string("FFF") == (255, 255, 255, 255)
-
-    with pytest.raises(ValueError):
-        arcade.color_from_hex_string("ppp")
-
-    with pytest.raises(ValueError):
-        arcade.color_from_hex_string("ff")
+        arcade.color_from_hex_string(code)
 
 
 def test_get_four_byte_color():
@@ -82,3 +82,6 @@ def test_load_texture():
     assert points_1 is not None
     assert points_2 is not None
     assert points_1 != points_2
+    # Textures share the cached points instead of holding a copy
+    assert texture_1.hit_box_points is points_1
+    assert texture_2.hit_box_points is points_2
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest as pytest
 
 import arcade
@@ -308,12 +311,78 @@ def update(delta_time):
     arcade.cleanup_texture_cache()
 
 
+def test_sprite_solid_color_texture_reuse(window):
+    sprite = arcade.SpriteSolidColor(13.5, 7.25, arcade.color.WHITE)
+    assert arcade.SpriteSolidColor(13.5, 7.25, arcade.color.RED).texture is sprite.texture
+
+    # The texture is released with the last sprite of that size
+    texture_ref = weakref.ref(sprite.texture)
+    del sprite
+    gc.collect()
+    assert texture_ref() is None
+
+
 def test_sprite_circle(window):
     # TODO: Improve this
     sprite = arcade.SpriteCircle(50, arcade.color.RED)
     sprite = arcade.SpriteCircle(50, arcade.color.RED, soft=True)
 
 
+def test_sprite_circle_texture_cache(window):
+    texture = arcade.SpriteCircle(10, arcade.color.RED).texture
+    assert arcade.SpriteCircle(10, arcade.color.GREEN).texture is texture
+    assert texture in arcade.Texture.cache.values()
+
+    # Clearing the texture cache also drops the circle textures
+    arcade.cleanup_texture_cache()
+    new_texture = arcade.SpriteCircle(10, arcade.color.RED).texture
+    assert new_texture is not texture
+    assert new_texture in arcade.Texture.cache.values()
+
+
+def test_sprite_circle_bulk_create(window):
+    sprites = arcade.SpriteCircle.bulk_create(
+        [10, 20, 10], [arcade.color.RED, arcade.color.GREEN, (0, 0, 255)],
+    )
+    assert len(sprites) == 3
+    assert [sprite.width for sprite in sprites] == [20, 40, 20]
+    assert sprites[0].color == arcade.color.RED
+    assert sprites[2].color == (0, 0, 255, 255)
+    # Same radius shares the texture with regular construction
+    assert sprites[0].texture is sprites[2].texture
+    assert sprites[0].texture is arcade.SpriteCircle(10, arcade.color.RED).texture
+
+    # Float radii share the texture of the truncated radius
+    sprites = arcade.SpriteCircle.bulk_create([10.0, 10.7], [arcade.color.RED, arcade.color.RED])
+    assert sprites[0].texture is sprites[1].texture
+
+    with pytest.raises(ValueError):
+        arcade.SpriteCircle.bulk_create([10, 20], [arcade.color.RED])
+
+
+def test_sprite_circle_prewarm(window):
+    arcade.cleanup_texture_cache()
+    cache = arcade.Texture.cache
+
+    # By default both the hard and soft textures are generated
+    arcade.SpriteCircle.prewarm([7, 9])
+    assert len(cache) == 4
+    for radius in (7, 9):
+        for soft in (False, True):
+            texture = arcade.SpriteCircle(radius, arcade.color.RED, soft=soft).texture
+            assert texture.width == radius * 2
+            assert texture in cache.values()
+    assert len(cache) == 4
+
+    arcade.cleanup_texture_cache()
+    cache = arcade.Texture.cache
+    arcade.SpriteCircle.prewarm([7], soft_variants=(True,))
+    assert len(cache) == 1
+    texture = arcade.SpriteCircle(7, arcade.color.RED, soft=True).texture
+    assert texture in cache.values()
+    assert len(cache) == 1
+
+
 def test_visible():
     sprite = arcade.Sprite(":resources:images/animated_characters/female_person/femalePerson_idle.png")
 
@@ -201,3 +201,22 @@ def test_crate_empty():
         (128.0, 128.0),
         (-128.0, 128.0)
     )
+
+
+def test_texture_from_image_data():
+    """Create a texture from an already hashed image"""
+    image = PIL.Image.new("RGBA", (40, 20), color=(255, 255, 255, 255))
+    image_data = arcade.ImageData(image)
+    tex = Texture("image_data", image_data)
+    assert tex.image is image
+    assert tex.size == (40, 20)
+    assert tex.hit_box_points == Texture("pil_image", image).hit_box_points
+    assert tex.hit_box_points == (
+        (-20.0, -10.0),
+        (20.0, -10.0),
+        (20.0, 10.0),
+        (-20.0, 10.0)
+    )
+
+    with pytest.raises(ValueError):
+        Texture("invalid", "not an image")